@@ -0,0 +1,172 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import re
+from collections import namedtuple
+
+# Shared core for the Mark Six analyzer: sampling logic plus the whole
+# Streamlit UI. Entry-point scripts only supply a loader that returns a
+# Counts tuple (or None on failure) for their particular data source.
+
+rng = np.random.default_rng()
+
+_TOKEN_RE = re.compile(r'\d+')
+
+def parse_bankers(s):
+    """Extracts banker numbers from free-form comma/space separated input."""
+    return list(map(int, _TOKEN_RE.findall(s)))
+
+# Structure-of-arrays form of the frequency analysis: the drawn numbers,
+# their raw counts, the cumulative counts, and normalized probabilities.
+Counts = namedtuple('Counts', 'pop weights cum p')
+
+def make_counts(counts):
+    """Builds a Counts tuple from a 50-element bincount array."""
+    nz = np.nonzero(counts)[0]
+    pop = nz.astype(np.int16)
+    weights = counts[nz].astype(np.float64)
+    state = Counts(pop, weights, np.cumsum(weights), weights / weights.sum())
+    # Frozen arrays: st.cache_data fingerprints them as one flat buffer,
+    # and nothing downstream can mutate the shared state.
+    for arr in state:
+        arr.flags.writeable = False
+    return state
+
+@st.cache_data # Rebuilt only when the counts change, not on every rerun.
+def top10_df(pop, weights):
+    """Builds the top-10 frequency table shown beside the results."""
+    # O(N) partial selection of the 10 largest counts, then a tail sort
+    k = min(10, weights.size)
+    idx = np.argpartition(weights, -k)[-k:]
+    idx = idx[np.argsort(-weights[idx])]
+    return pd.DataFrame([{"號碼 (Number)": int(pop[i]), "開出次數 (Frequency)": int(weights[i])} for i in idx])
+
+def generate_weighted_combinations(number_counts, num_combinations=5, num_per_combo=6):
+    """Generates weighted combinations as a (num_combinations, num_per_combo) array."""
+    if number_counts is None: return np.empty((0, num_per_combo), dtype=np.int16)
+
+    population, p = number_counts.pop, number_counts.p
+    if population.size < num_per_combo: return np.empty((0, num_per_combo), dtype=np.int16)
+
+    combinations = np.empty((num_combinations, num_per_combo), dtype=np.int16)
+    for i in range(num_combinations):
+        # Weighted sampling without replacement in one C call - no
+        # oversample/dedupe round trip, no short rows to retry
+        combinations[i] = rng.choice(population, size=num_per_combo, replace=False, p=p)
+    combinations.sort(axis=1)
+    return combinations
+
+def generate_banker_combinations(number_counts, bankers, num_combinations=5, num_per_combo=6):
+    """Generates banker+legs combinations as a (num_combinations, num_per_combo) array."""
+    legs_needed = num_per_combo - len(bankers)
+    if legs_needed <= 0: return np.empty((0, num_per_combo), dtype=np.int16)
+
+    # Mask the bankers out of the population instead of rebuilding lists
+    population, weights = number_counts.pop, number_counts.weights
+    banker_arr = np.asarray(bankers, dtype=np.int16)
+    leg_mask = np.isin(population, banker_arr, invert=True)
+    leg_population = population[leg_mask]
+    leg_weights = weights[leg_mask]
+    if leg_population.size < legs_needed: return np.empty((0, num_per_combo), dtype=np.int16)
+    leg_p = leg_weights / leg_weights.sum()
+
+    combinations = np.empty((num_combinations, num_per_combo), dtype=np.int16)
+    combinations[:, :banker_arr.size] = banker_arr
+    for i in range(num_combinations):
+        combinations[i, banker_arr.size:] = rng.choice(leg_population, size=legs_needed, replace=False, p=leg_p)
+    combinations.sort(axis=1)
+
+    return combinations
+
+def render_app(load_counts):
+    """Renders the full app UI around the given counts loader."""
+    st.set_page_config(page_title="Mark Six Analyzer", layout="wide")
+
+    st.title("六合彩號碼分析與生成器 (Mark Six Analyzer)")
+    st.caption("此工具根據歷史數據分析號碼頻率，生成建議組合。僅供娛樂參考。")
+
+    # Load the data
+    number_counts = load_counts()
+
+    if number_counts is None:
+        return
+
+    # --- UI Tabs ---
+    tab1, tab2 = st.tabs(["**數據分析建議 (Weighted Suggestions)**", "**膽拖選項 (Banker and Legs)**"])
+
+    with tab1:
+        st.header("根據歷史數據頻率生成建議組合")
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("生成 5 組 **6** 個號碼", use_container_width=True, type="primary"):
+                st.session_state.combinations = generate_weighted_combinations(number_counts, 5, 6)
+                st.session_state.last_action = ('weighted', 6)
+        with col2:
+            if st.button("生成 5 組 **7** 個號碼", use_container_width=True, type="secondary"):
+                st.session_state.combinations = generate_weighted_combinations(number_counts, 5, 7)
+                st.session_state.last_action = ('weighted', 7)
+
+    with tab2:
+        st.header("膽拖 (Banker) 建議")
+        st.write("請輸入 1-5 個您認為必出的號碼 (膽碼)，程式會根據數據分析補全剩餘的號碼 (腳)。")
+
+        banker_input = st.text_input("請輸入膽碼 (以逗號/空格分隔):", placeholder="例如: 8, 15, 22")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("生成 **6** 個號碼的膽拖組合", use_container_width=True, type="primary"):
+                bankers = parse_bankers(banker_input)
+                if not (1 <= len(bankers) <= 5):
+                    st.warning("膽碼數量必須介於 1 到 5 之間。")
+                elif not all(1 <= b <= 49 for b in bankers):
+                    st.warning("膽碼必須是 1 到 49 之間的號碼。")
+                elif len(bankers) != len(set(bankers)):
+                    st.warning("膽碼不能包含重覆的數字。")
+                else:
+                    st.session_state.combinations = generate_banker_combinations(number_counts, bankers, 5, 6)
+                    st.session_state.last_action = ('banker', 6, bankers)
+
+        with col2:
+            if st.button("生成 **7** 個號碼的膽拖組合", use_container_width=True, type="secondary"):
+                bankers = parse_bankers(banker_input)
+                if not (1 <= len(bankers) <= 6): # Max 6 bankers for 7 numbers
+                    st.warning("膽碼數量必須介於 1 到 6 之間。")
+                elif not all(1 <= b <= 49 for b in bankers):
+                    st.warning("膽碼必須是 1 到 49 之間的號碼。")
+                elif len(bankers) != len(set(bankers)):
+                    st.warning("膽碼不能包含重覆的數字。")
+                else:
+                    st.session_state.combinations = generate_banker_combinations(number_counts, bankers, 5, 7)
+                    st.session_state.last_action = ('banker', 7, bankers)
+
+    # --- Display Results ---
+    if 'combinations' in st.session_state and len(st.session_state.combinations):
+        st.divider()
+        results_col, freq_col = st.columns([2, 1])
+
+        with results_col:
+            st.subheader("💡 建議組合")
+
+            # Reserve the slot above the button, then handle Redraw before
+            # filling it, so a fresh draw renders in this same script pass
+            # without forcing a second full rerun.
+            combos_slot = st.container()
+
+            # Redraw button
+            if st.button("重新生成 (Redraw)", use_container_width=True):
+                action = st.session_state.get('last_action')
+                if action:
+                    if action[0] == 'weighted':
+                        st.session_state.combinations = generate_weighted_combinations(number_counts, 5, action[1])
+                    elif action[0] == 'banker':
+                        st.session_state.combinations = generate_banker_combinations(number_counts, action[2], 5, action[1])
+
+            # Display generated combinations
+            with combos_slot:
+                for i, combo in enumerate(st.session_state.combinations):
+                    combo_str = ' - '.join(f"{n:02d}" for n in combo)
+                    st.markdown(f"### <font color='blue'>組 {i+1}:</font> `{combo_str}`", unsafe_allow_html=True)
+
+        with freq_col:
+            st.subheader("📊 十大熱門號碼")
+            st.dataframe(top10_df(number_counts.pop, number_counts.weights), use_container_width=True)